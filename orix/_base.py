@@ -19,10 +19,16 @@
 
 from __future__ import annotations
 
+import math
 from typing import Any, Optional, Tuple, Union
 
+import numba as nb
 import numpy as np
 
+# Reused by all calls to Object3d.get_random_sample() without a
+# generator, to avoid seeding a new one from OS entropy every time
+_DEFAULT_RNG = np.random.default_rng()
+
 
 class DimensionError(Exception):
     """Error raised when an array passed to a class constructor has an
@@ -91,7 +97,7 @@ class Object3d:
     @property
     def shape(self) -> tuple:
         """Return the shape of the object."""
-        return self.data.shape[:-1]
+        return self._data.shape[:-1]
 
     @property
     def ndim(self) -> int:
@@ -100,24 +106,30 @@ class Object3d:
         For example, if :attr:`data` has shape (4, 5, 6), :attr:`ndim`
         is 3.
         """
-        return len(self.shape)
+        return self._data.ndim - 1
 
     @property
     def size(self) -> int:
         """Return the total number of entries in this object."""
-        return int(np.prod(self.shape))
+        return math.prod(self._data.shape[:-1])
 
     @property
     def norm(self) -> np.ndarray:
         """Return the norm of the data."""
-        return np.sqrt(np.sum(np.square(self.data), axis=-1))
+        data = self.data
+        return np.sqrt(np.einsum("...i,...i->...", data, data))
 
     @property
     def unit(self) -> Object3d:
         """Return the unit object."""
-        with np.errstate(divide="ignore", invalid="ignore"):
-            obj = self.__class__(np.nan_to_num(self.data / self.norm[..., np.newaxis]))
-            return obj
+        data = self.data
+        norm = self.norm[..., np.newaxis]
+        # Entries with zero norm are left as zeros. Any additional data
+        # stored after the first dim values is kept.
+        unit_data = np.zeros(self._data.shape, dtype=np.result_type(data, norm))
+        unit_data[..., self.dim :] = self._data[..., self.dim :]
+        np.divide(data, norm, out=unit_data[..., : self.dim], where=norm > 0)
+        return self._from_data(unit_data)
 
     # ------------------------ Dunder methods ------------------------ #
 
@@ -130,9 +142,11 @@ class Object3d:
 
     def __getitem__(self, key) -> Object3d:
         """Return a slice of the object."""
-        data = np.atleast_2d(self.data[key])
-        obj = self.__class__(data)
-        return obj
+        data = np.atleast_2d(self._data[key])
+        # Keys indexing the last axis would give invalid data
+        if data.shape[-1] != self._data.shape[-1]:
+            raise DimensionError(self, data)
+        return self._from_data(data)
 
     def __setitem__(self, key, value: np.ndarray):
         """Set a slice of the data."""
@@ -143,7 +157,7 @@ class Object3d:
     @classmethod
     def empty(cls) -> Object3d:
         """Return an empty object with the appropriate dimensions."""
-        return cls(np.zeros((0, cls.dim)))
+        return cls._from_data(np.empty((0, cls.dim)))
 
     @classmethod
     def stack(cls, sequence: Any) -> Object3d:
@@ -156,9 +170,7 @@ class Object3d:
         """
         sequence = [s._data for s in sequence]
         stack = np.stack(sequence, axis=-2)
-        obj = cls(stack[..., : cls.dim])
-        obj._data = stack
-        return obj
+        return cls._from_data(stack)
 
     @classmethod
     def random(cls, shape: Union[int, tuple] = 1) -> Object3d:
@@ -175,25 +187,51 @@ class Object3d:
             Object with random data.
         """
         n = int(np.prod(shape))
-        obj = []
-        while len(obj) < n:
+        # Sample uniformly within the unit ball, rejecting points outside
+        # of it or too close to the origin, then project onto the sphere
+        data = np.empty((n, cls.dim))
+        n_accepted = 0
+        while n_accepted < n:
             r = np.random.uniform(-1, 1, (3 * n, cls.dim))
-            r2 = np.sum(np.square(r), axis=1)
-            r = r[np.logical_and(1e-9**2 < r2, r2 <= 1)]
-            obj += list(r)
-        obj = cls(np.array(obj[:n]))
-        obj = obj.unit
+            r2 = np.einsum("ij,ij->i", r, r)
+            is_accepted = np.logical_and(1e-9**2 < r2, r2 <= 1)
+            r = r[is_accepted]
+            r /= np.sqrt(r2[is_accepted])[:, np.newaxis]
+            n_new = min(r.shape[0], n - n_accepted)
+            data[n_accepted : n_accepted + n_new] = r[:n_new]
+            n_accepted += n_new
+        obj = cls(data)
         obj = obj.reshape(shape)
         return obj
 
+    @classmethod
+    def _from_data(cls, data: np.ndarray) -> Object3d:
+        """Return a new object storing the array as is, without the
+        validation done in :meth:`__init__`.
+
+        Parameters
+        ----------
+        data
+            Array of shape (..., n) with n equal to or greater than
+            :attr:`dim`, to be used as the stored data.
+
+        Returns
+        -------
+        obj
+            New object.
+        """
+        obj = cls.__new__(cls)
+        obj._data = data
+        obj.__finalize__(data)
+        return obj
+
     # --------------------- Other public methods --------------------- #
 
     def flatten(self):
         """Return a new object with the same data in a single column."""
-        obj = self.__class__(self.data.T.reshape(self.dim, -1).T)
+        # Navigation axes are collapsed in column-major order
         real_dim = self._data.shape[-1]
-        obj._data = self._data.T.reshape(real_dim, -1).T
-        return obj
+        return self._from_data(self._data.reshape(-1, real_dim, order="F"))
 
     def unique(self, return_index: bool = False, return_inverse: bool = False) -> Union[
         Tuple[Object3d, np.ndarray, np.ndarray],
@@ -227,11 +265,21 @@ class Object3d:
             The indices of the (flattened) data in the unique array if
             ``return_inverse=True``.
         """
-        data = self.flatten()._data.round(10)
-        data = data[~np.all(np.isclose(data, 0), axis=1)]  # Remove zeros
-        _, idx, inv = np.unique(data, axis=0, return_index=True, return_inverse=True)
-        obj = self.__class__(data[np.sort(idx), : self.dim])
-        obj._data = data[np.sort(idx)]
+        # Same entry order as flatten(), without creating a new object
+        data = self._data.reshape(-1, self._data.shape[-1], order="F")
+        data = _round_and_remove_zeros(data.astype(np.float64, copy=False))
+        # Find first occurrences with a hash table. Adding zero turns
+        # -0.0 into 0.0 so that equal values have equal bit patterns.
+        idx_sort, inv = _unique_rows((data + 0.0).view(np.uint64))
+        # Order indices as numpy.unique() does, by sorting only the
+        # unique rows lexicographically
+        order = np.lexsort(data[idx_sort].T[::-1])
+        idx = idx_sort[order]
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+        inv = rank[inv]
+        # Rounding is done in double precision, so restore the data type
+        obj = self._from_data(data[idx_sort].astype(self._data.dtype, copy=False))
         if return_index and return_inverse:
             return obj, idx, inv
         elif return_index and not return_inverse:
@@ -250,9 +298,7 @@ class Object3d:
         obj
             Squeezed object.
         """
-        obj = self.__class__(self)
-        obj._data = np.atleast_2d(self._data.squeeze())
-        return obj
+        return self._from_data(np.atleast_2d(self._data.squeeze()))
 
     def reshape(self, *shape: Union[int, tuple]) -> Object3d:
         """Return a new object with the same data in a new shape.
@@ -269,9 +315,7 @@ class Object3d:
         """
         if len(shape) == 1 and isinstance(shape[0], tuple):
             shape = shape[0]
-        obj = self.__class__(self.data.reshape(*shape, self.dim))
-        obj._data = self._data.reshape(*shape, self._data.shape[-1])
-        return obj
+        return self._from_data(self._data.reshape(*shape, self._data.shape[-1]))
 
     def transpose(self, *axes: Optional[int]) -> Object3d:
         """Return a new object with the same data transposed.
@@ -309,10 +353,14 @@ class Object3d:
                 + f"{tuple(axes)} does not fit with {self.shape}."
             )
 
-        return self.__class__(self.data.transpose(*axes + (-1,)))
+        return self._from_data(self._data.transpose(*axes + (-1,)))
 
     def get_random_sample(
-        self, size: Optional[int] = 1, replace: bool = False, shuffle: bool = False
+        self,
+        size: Optional[int] = 1,
+        replace: bool = False,
+        shuffle: bool = False,
+        rng: Optional[np.random.Generator] = None,
     ):
         """Return a new flattened object from a random sample of a given
         size.
@@ -326,6 +374,9 @@ class Object3d:
             See :meth:`numpy.random.Generator.choice`.
         shuffle
             See :meth:`numpy.random.Generator.choice`.
+        rng
+            Random number generator to draw the sample with. If not
+            given, a generator shared by all objects is used.
 
         Returns
         -------
@@ -340,7 +391,91 @@ class Object3d:
         n = self.size
         if size > n:
             raise ValueError(f"Cannot draw a sample greater than {self.size}")
-        rng = np.random.default_rng()
+        if rng is None:
+            rng = _DEFAULT_RNG
         sample = rng.choice(n, size=size, replace=replace, shuffle=shuffle)
-        sample = np.unravel_index(sample, shape=self.shape)
-        return self[sample]
+        # Index into a row-major flattened view rather than unraveling
+        # the indices into one index array per navigation dimension
+        return self.reshape(-1)[sample]
+
+
+# ------------------- Numba accelerated functions -------------------- #
+
+
+@nb.njit("float64[:, :](float64[:, :])", cache=True, nogil=True)
+def _round_and_remove_zeros(data: np.ndarray) -> np.ndarray:  # pragma: no cover
+    """Return the rows of a 2D array rounded to 10 decimals, with rows
+    with all values close to zero removed.
+
+    Equivalent to rounding with :func:`numpy.round` and removing rows
+    where :func:`numpy.isclose` is ``True`` for all values, but in a
+    single pass over the data.
+    """
+    n, m = data.shape
+    out = np.empty((n, m))
+    count = 0
+    for i in range(n):
+        is_zero = True
+        for j in range(m):
+            value = np.round(data[i, j], 10)
+            out[count, j] = value
+            if abs(value) > 1e-8:
+                is_zero = False
+        if not is_zero:
+            count += 1
+    return out[:count]
+
+
+@nb.njit("uint64(uint64)", cache=True, nogil=True)
+def _splitmix64(x: np.uint64) -> np.uint64:  # pragma: no cover
+    """Return a well-mixed 64-bit hash of an unsigned integer."""
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+@nb.njit("Tuple((int64[:], int64[:]))(uint64[:, :])", cache=True, nogil=True)
+def _unique_rows(rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:  # pragma: no cover
+    """Return the indices of the first occurrence of each unique row in
+    a 2D array, in ascending order, and the indices into these for all
+    rows.
+
+    Rows are compared by their bit patterns, looked up in an open
+    addressing hash table, so that only a single pass over the data is
+    needed.
+    """
+    n, m = rows.shape
+    table_size = 1
+    while table_size < 2 * n:
+        table_size *= 2
+    table_mask = np.uint64(table_size - 1)
+    table = np.full(table_size, -1, dtype=np.int64)
+
+    first = np.empty(n, dtype=np.int64)
+    inv = np.empty(n, dtype=np.int64)
+    n_unique = 0
+    for i in range(n):
+        h = np.uint64(0)
+        for j in range(m):
+            h = _splitmix64(h ^ rows[i, j])
+        k = np.int64(h & table_mask)
+        while True:
+            slot = table[k]
+            if slot == -1:
+                # New row
+                table[k] = n_unique
+                first[n_unique] = i
+                inv[i] = n_unique
+                n_unique += 1
+                break
+            is_equal = True
+            for j in range(m):
+                if rows[first[slot], j] != rows[i, j]:
+                    is_equal = False
+                    break
+            if is_equal:
+                inv[i] = slot
+                break
+            k = (k + 1) % table_size
+    return first[:n_unique].copy(), inv
@@ -871,7 +871,7 @@ def eu2qu(eu: np.ndarray) -> np.ndarray:
     """N-dimensional wrapper for eu2qu_2d, see the docstring of that
     function.
     """
-    eu2d = eu.astype(np.float64)
+    eu2d = eu.astype(np.float64, copy=False)
     eu2d = eu2d.reshape(-1, 3)
 
     qu = eu2qu_2d(eu2d)
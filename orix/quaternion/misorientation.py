@@ -18,15 +18,12 @@
 from __future__ import annotations
 
 from itertools import product as iproduct
-from typing import Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 import warnings
 
-import dask.array as da
-from dask.diagnostics import ProgressBar
 from matplotlib.gridspec import SubplotSpec
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.spatial.transform import Rotation as SciPyRotation
 from tqdm import tqdm
 
 from orix.quaternion.orientation_region import OrientationRegion
@@ -34,6 +31,9 @@ from orix.quaternion.rotation import Rotation
 from orix.quaternion.symmetry import C1, Symmetry, _get_unique_symmetry_elements
 from orix.vector import Miller
 
+if TYPE_CHECKING:  # pragma: no cover
+    from scipy.spatial.transform import Rotation as SciPyRotation
+
 
 class Misorientation(Rotation):
     r"""Misorientations :math:`M`.
@@ -536,6 +536,9 @@ class Misorientation(Rotation):
         array([[ 0., 90.],
                [90.,  0.]])
         """
+        import dask.array as da
+        from dask.diagnostics import ProgressBar
+
         # Reduce symmetry operations to the unique ones
         symmetry = _get_unique_symmetry_elements(*self.symmetry)
 
@@ -17,22 +17,23 @@
 
 from __future__ import annotations
 
-from typing import Optional, Tuple, Union
+from typing import TYPE_CHECKING, Optional, Tuple, Union
 import warnings
 
-import dask.array as da
-from dask.diagnostics import ProgressBar
 from diffpy.structure import Structure
 from matplotlib.gridspec import SubplotSpec
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.spatial.transform import Rotation as SciPyRotation
 
 from orix.quaternion.misorientation import Misorientation
 from orix.quaternion.rotation import Rotation
 from orix.quaternion.symmetry import C1, Symmetry, _get_unique_symmetry_elements
 from orix.vector import Miller, Vector3d
 
+if TYPE_CHECKING:  # pragma: no cover
+    import dask.array as da
+    from scipy.spatial.transform import Rotation as SciPyRotation
+
 
 class Orientation(Misorientation):
     r"""Orientations represent misorientations away from a reference of
@@ -468,6 +469,9 @@ class Orientation(Misorientation):
         """
         O = self.unit
         if lazy:
+            import dask.array as da
+            from dask.diagnostics import ProgressBar
+
             dot_products = O._dot_outer_dask(other, chunk_size=chunk_size)
             # Round because some dot products are slightly above 1
             n_decimals = np.finfo(dot_products.dtype).precision
@@ -848,6 +852,8 @@ class Orientation(Misorientation):
         To read the dot products array `dparr` into memory, do
         `dp = dparr.compute()`.
         """
+        import dask.array as da
+
         symmetry = _get_unique_symmetry_elements(self.symmetry, other.symmetry)
         M = other._outer_dask(~self, chunk_size=chunk_size)
 
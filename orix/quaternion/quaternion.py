@@ -17,20 +17,24 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, Tuple, Union
+import math
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
 import warnings
 
-import dask.array as da
-from dask.diagnostics import ProgressBar
 import numba as nb
 import numpy as np
-from scipy.spatial.transform import Rotation as SciPyRotation
 
 from orix._base import Object3d
-from orix.constants import installed
 from orix.quaternion import _conversions
 from orix.vector import AxAngle, Homochoric, Miller, Rodrigues, Vector3d
 
+if TYPE_CHECKING:  # pragma: no cover
+    import dask.array as da
+    from scipy.spatial.transform import Rotation as SciPyRotation
+
+# Signs of the quaternion components in the conjugate
+_CONJ_SIGN = np.array([1.0, -1.0, -1.0, -1.0])
+
 
 class Quaternion(Object3d):
     r"""Quaternions.
@@ -153,73 +157,62 @@ class Quaternion(Object3d):
         r"""Return the axis of rotation
         :math:`\hat{\mathbf{n}} = (b, c, d)`.
         """
-        axis = Vector3d(np.stack((self.b, self.c, self.d), axis=-1))
-        a_is_zero = self.a < -1e-6
-        axis[a_is_zero] = -axis[a_is_zero]
-        norm_is_zero = axis.norm == 0
-        axis[norm_is_zero] = Vector3d.zvector() * np.sign(self.a[norm_is_zero])
-        axis.data /= axis.norm[..., np.newaxis]
-        return axis
+        a = self.a
+        dtype = np.result_type(self.data.dtype, np.float32)
+        axis = self.data[..., 1:4].astype(dtype)
+        np.negative(axis, out=axis, where=(a < -1e-6)[..., np.newaxis])
+        norm2 = np.einsum("...i,...i->...", axis, axis)
+        norm_is_zero = norm2 == 0
+        if norm_is_zero.any():
+            sign = np.sign(a[norm_is_zero])
+            axis[norm_is_zero] = np.outer(sign, [0, 0, 1])
+            norm2[norm_is_zero] = sign**2
+        axis /= np.sqrt(norm2)[..., np.newaxis]
+        return Vector3d._from_data(axis)
 
     @property
     def angle(self) -> np.ndarray:
         r"""Return the angle of rotation :math:`\omega = 2\arccos{|a|}`."""
-        return 2 * np.nan_to_num(np.arccos(np.abs(self.a)))
+        # Clamp to avoid NaN from arccos when rounding gives |a| > 1.
+        # NaN is also replaced by 1, giving an angle of 0.
+        a = np.fmin(np.abs(self.a), 1.0)
+        np.arccos(a, out=a)
+        a *= 2
+        return a
 
     @property
     def antipodal(self) -> Quaternion:
         """Return the quaternion and its antipodal."""
-        return self.__class__(np.stack([self.data, -self.data]))
+        data = self.data
+        qu = np.empty((2,) + data.shape, dtype=data.dtype)
+        qu[0] = data
+        np.negative(data, out=qu[1])
+        return self.__class__(qu)
 
     @property
     def conj(self) -> Quaternion:
         r"""Return the conjugate of the quaternion
         :math:`Q^{*} = a - bi - cj - dk`.
         """
-        if installed["numpy-quaternion"]:
-            import quaternion
-
-            qu2 = quaternion.from_float_array(self.data).conj()
-            qu2 = quaternion.as_float_array(qu2)
-        else:  # pragma: no cover
-            qu1 = self.data.astype(np.float64)
-            qu2 = np.empty_like(qu1)
-            qu_conj_gufunc(qu1, qu2)
-        Q = self.__class__(qu2)
+        qu = np.multiply(self.data, _CONJ_SIGN, dtype=_float_dtype(self.data))
+        Q = self.__class__(qu)
         return Q
 
     # ------------------------ Dunder methods ------------------------ #
 
     def __invert__(self) -> Quaternion:
-        return self.__class__(self.conj.data / (self.norm**2)[..., np.newaxis])
+        return self.__class__(qu_invert(self.data))
 
     def __mul__(
         self, other: Union[Quaternion, Vector3d]
     ) -> Union[Quaternion, Vector3d]:
         if isinstance(other, Quaternion):
-            if installed["numpy-quaternion"]:
-                import quaternion
-
-                qu1 = quaternion.from_float_array(self.data)
-                qu2 = quaternion.from_float_array(other.data)
-                qu12 = quaternion.as_float_array(qu1 * qu2)
-            else:  # pragma: no cover
-                qu12 = qu_multiply(self.data, other.data)
+            qu12 = qu_multiply(self.data, other.data)
             Q = self.__class__(qu12)
             return Q
         elif isinstance(other, Vector3d):
-            if installed["numpy-quaternion"]:
-                import quaternion
-
-                # Don't use rotate_vectors as it may perform an outer
-                # product. The following keeps current __mul__ broadcast
-                # behavior.
-                qu = quaternion.from_float_array(self.data)
-                v = quaternion.as_vector_part(
-                    (qu * quaternion.from_vector_part(other.data)) * ~qu
-                )
-            else:  # pragma: no cover
-                v = qu_rotate_vec(self.unit.data, other.data)
+            # Quaternions are normalized inside the compiled function
+            v = qu_rotate_vec(self.data, other.data)
             if isinstance(other, Miller):
                 m = other.__class__(xyz=v, phase=other.phase)
                 m.coordinate_format = other.coordinate_format
@@ -286,14 +279,33 @@ class Quaternion(Object3d):
         if np.size(axes) == 0:
             return cls.empty()
 
-        axes = Vector3d(axes).unit.data
-        angles = np.array(angles)
+        axes = Vector3d(axes).data
+        angles = np.array(angles, dtype=np.float64)
+
+        if axes.shape == (1, 3) and angles.size == 1 and angles.ndim <= 2:
+            # Skip the vectorized conversion for a single pair
+            x, y, z = axes[0].tolist()
+            angle = angles.item()
+            if degrees:
+                angle = math.radians(angle)
+            norm2 = x * x + y * y + z * z
+            if norm2 > 0 and abs(norm2 - 1) > 1e-12:
+                norm = math.sqrt(norm2)
+                x, y, z = x / norm, y / norm, z / norm
+            ax = np.array([x, y, z, angle], dtype=np.float64)
+            return cls(_conversions.ax2qu_single(ax))
+
+        # Only normalize axes not already of unit length
+        norm2 = np.einsum("...i,...i->...", axes, axes)
+        if np.abs(norm2 - 1).max() > 1e-12:
+            axes = Vector3d(axes).unit.data
         if degrees:
-            angles = np.deg2rad(angles)
+            # The angles are already copied
+            angles *= np.pi / 180
 
+        # Quaternions are normalized by the conversion
         qu = _conversions.ax2qu(axes, angles)
         Q = cls(qu)
-        Q = Q.unit
 
         return Q
 
@@ -339,7 +351,6 @@ class Quaternion(Object3d):
         Q = _conversions.ax2qu(ax[:, :3], ax[:, 3])
         Q = Q.reshape(*shape, 4)
         Q = cls(Q)
-        Q = Q.unit
 
         return Q
 
@@ -416,21 +427,27 @@ class Quaternion(Object3d):
         shape = ro.shape[:-1]
         ro = ro.reshape(-1, 3)
 
+        ax = np.zeros((ro.shape[0], 4))
         if angles is None:
-            norm = Vector3d(ro).norm
-            if np.min(norm) < np.finfo(norm.dtype).resolution * 1000:
+            dtype = np.result_type(ro.dtype, np.float32)
+            norm2 = np.einsum("ij,ij->i", ro, ro, dtype=dtype)
+            tol = np.finfo(norm2.dtype).resolution * 1000
+            if np.min(norm2) < tol**2:
                 warnings.warn(
                     "Max. estimated error is greater than 0.1%. Rodrigues vectors have "
                     "increasing associated errors for small angle rotations. Consider "
                     "creating quaternions in another way."
                 )
-            angles = 2 * np.arctan(norm)
-            angles = angles[:, np.newaxis]
-            ax = np.hstack((ro, angles))
+            norm = np.sqrt(norm2)[:, np.newaxis]
+            # Zero vectors are left as zeros
+            np.divide(ro, norm, out=ax[:, :3], where=norm > 0)
+            angles = np.arctan(norm, out=ax[:, 3:])
+            angles *= 2
         else:
-            angles = angles.ravel()[:, np.newaxis]
-            ro_axes_angles = np.hstack((ro, angles))
-            ax = _conversions.ro2ax(ro_axes_angles)
+            ax[:, :3] = ro
+            ax[:, 3] = angles.ravel()
+            angles = ax[:, 3]
+            ax = _conversions.ro2ax_2d(ax)
 
         if np.rad2deg(np.max(angles)) > 179.999:
             warnings.warn(
@@ -441,7 +458,6 @@ class Quaternion(Object3d):
 
         Q = cls.from_axes_angles(ax[:, :3], ax[:, 3])
         Q = Q.reshape(*shape)
-        Q = Q.unit
 
         return Q
 
@@ -489,10 +505,11 @@ class Quaternion(Object3d):
                 f"The chosen direction is not one of the allowed options {directions}"
             )
 
-        if degrees:
-            euler = np.deg2rad(euler)
-
         eu = np.atleast_2d(euler)
+        if degrees:
+            # Convert a copy in place to not modify the input
+            eu = eu.astype(np.float64)
+            eu *= np.pi / 180
         if np.any(np.abs(eu) > 4 * np.pi):
             warnings.warn("Angles are quite high, did you forget to set degrees=True?")
 
@@ -594,8 +611,16 @@ class Quaternion(Object3d):
         Vector3d (1,)
         [[-1.  1.  0.]]
         """
-        matrix = rotation.inv().as_matrix()
-        return cls.from_matrix(matrix=matrix)
+        # The inverse is the conjugate, with the scalar moved first
+        xyzw = np.atleast_2d(rotation.as_quat())
+        qu = np.empty_like(xyzw)
+        qu[..., 0] = xyzw[..., 3]
+        np.negative(xyzw[..., :3], out=qu[..., 1:])
+        # Return quaternions with a non-negative scalar as from_matrix()
+        # does, and replace negative zeros by adding zero
+        qu[qu[..., 0] < 0] *= -1
+        qu += 0.0
+        return cls(qu)
 
     @classmethod
     def from_align_vectors(
@@ -666,6 +691,8 @@ class Quaternion(Object3d):
             other = Vector3d(other)
         if not isinstance(initial, Vector3d):
             initial = Vector3d(initial)
+        from scipy.spatial.transform import Rotation as SciPyRotation
+
         v1 = initial.unit.data
         v2 = other.unit.data
 
@@ -698,44 +725,8 @@ class Quaternion(Object3d):
         Q
             Quaternions resulting from the triple cross product.
         """
-        Q1a, Q1b, Q1c, Q1d = q1.a, q1.b, q1.c, q1.d
-        Q2a, Q2b, Q2c, Q2d = q2.a, q2.b, q2.c, q2.d
-        Q3a, Q3b, Q3c, Q3d = q3.a, q3.b, q3.c, q3.d
-        # fmt: off
-        a = (
-            + Q1b * Q2c * Q3d
-            - Q1b * Q3c * Q2d
-            - Q2b * Q1c * Q3d
-            + Q2b * Q3c * Q1d
-            + Q3b * Q1c * Q2d
-            - Q3b * Q2c * Q1d
-        )
-        b = (
-            + Q1a * Q3c * Q2d
-            - Q1a * Q2c * Q3d
-            + Q2a * Q1c * Q3d
-            - Q2a * Q3c * Q1d
-            - Q3a * Q1c * Q2d
-            + Q3a * Q2c * Q1d
-        )
-        c = (
-            + Q1a * Q2b * Q3d
-            - Q1a * Q3b * Q2d
-            - Q2a * Q1b * Q3d
-            + Q2a * Q3b * Q1d
-            + Q3a * Q1b * Q2d
-            - Q3a * Q2b * Q1d
-        )
-        d = (
-            + Q1a * Q3b * Q2c
-            - Q1a * Q2b * Q3c
-            + Q2a * Q1b * Q3c
-            - Q2a * Q3b * Q1c
-            - Q3a * Q1b * Q2c
-            + Q3a * Q2b * Q1c
-        )
-        # fmt: on
-        Q = cls(np.vstack((a, b, c, d)).T)
+        qu = qu_triple_cross(q1.data, q2.data, q3.data)
+        Q = cls(qu)
         return Q
 
     @classmethod
@@ -752,10 +743,10 @@ class Quaternion(Object3d):
         Q
             Identity quaternions.
         """
-        shape = (shape,) if isinstance(shape, int) else shape
-        Q = np.zeros(shape + (4,))
-        Q[..., 0] = 1
-        return cls(Q)
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        qu = np.zeros(shape + (cls.dim,))
+        qu[..., 0] = 1
+        return cls._from_data(qu)
 
     # ---------------------- All "to_*" methods- --------------------- #
 
@@ -900,9 +891,10 @@ class Quaternion(Object3d):
             ro = Q.axis * np.tan(self.angle / 2)
             ro = Rodrigues(ro)
         else:
-            axes, angles = _conversions.qu2ax(Q.data)
-            axes_angles = np.concatenate((axes, angles), axis=-1)
-            ro = _conversions.ax2ro(axes_angles)
+            # Pass axis-angle pairs directly between the conversions
+            qu = Q.data.reshape(-1, 4).astype(np.float64, copy=False)
+            ax = _conversions.qu2ax_2d(qu)
+            ro = _conversions.ax2ro_2d(ax).reshape(Q.shape + (4,))
         return ro
 
     def to_homochoric(self) -> Homochoric:
@@ -974,7 +966,7 @@ class Quaternion(Object3d):
         >>> Q1.dot(Q2)
         array([0.9239    , 0.92389686])
         """
-        return np.sum(self.data * other.data, axis=-1)
+        return np.einsum("...i,...i->...", self.data, other.data)
 
     def dot_outer(self, other: Quaternion) -> np.ndarray:
         """Return the dot products of all quaternions to all the other
@@ -1004,7 +996,10 @@ class Quaternion(Object3d):
         array([[0.9239    , 0.7071    ],
                [1.0000505 , 0.92389686]])
         """
-        dots = np.tensordot(self.data, other.data, axes=(-1, -1))
+        # Matrix product of the flattened arrays is dispatched to BLAS
+        qu1 = self.data.reshape(-1, self.dim)
+        qu2 = other.data.reshape(-1, other.dim)
+        dots = np.matmul(qu1, qu2.T).reshape(self.shape + other.shape)
         return dots
 
     def mean(self) -> Quaternion:
@@ -1020,17 +1015,18 @@ class Quaternion(Object3d):
         The method used here corresponds to Equation (13) in
         https://arc.aiaa.org/doi/pdf/10.2514/1.28949.
         """
-        Q = self.flatten().data.T
-        QQ = Q.dot(Q.T)
-        w, v = np.linalg.eig(QQ)
-        w_max = np.argmax(w)
-        return self.__class__(v[:, w_max])
+        Q = self.data.reshape(-1, self.dim)
+        QQ = np.matmul(Q.T, Q)
+        # QQ is real and symmetric, so the eigenvalues are real and
+        # returned in ascending order
+        w, v = np.linalg.eigh(QQ)
+        return self.__class__(v[:, -1])
 
     def outer(
         self,
         other: Union[Quaternion, Vector3d],
         lazy: bool = False,
-        chunk_size: int = 20,
+        chunk_size: Optional[int] = None,
         progressbar: bool = True,
     ) -> Union[Quaternion, Vector3d]:
         """Return the outer products of the quaternions and the other
@@ -1047,7 +1043,9 @@ class Quaternion(Object3d):
         chunk_size
             When using ``lazy`` computation, ``chunk_size`` represents
             the number of objects per axis for each input to include in
-            each iteration of the computation. Default is 20.
+            each iteration of the computation. If not given (default),
+            it is chosen so that each chunk of the output is about the
+            size of Dask's ``array.chunk-size`` configuration.
         progressbar
             Whether to show a progressbar during computation if
             ``lazy=True``. Default is ``True``.
@@ -1062,47 +1060,50 @@ class Quaternion(Object3d):
         NotImplementedError
             If ``other`` is not a quaternion, 3D vector, or a Miller
             index.
+
+        Notes
+        -----
+        The returned instance has shape ``self.shape + other.shape``.
+        To instead multiply quaternions and quaternions or vectors of
+        matching (broadcastable) shapes element-wise, use
+        ``self * other``, which does not allocate the outer product.
+
+        Single precision (32-bit) data is kept if both operands are in
+        single precision, which halves the memory of the result at a
+        precision of about 1e-7.
         """
+        if isinstance(other, (Quaternion, Vector3d)) and 1 in (self.size, other.size):
+            # The output is no larger than the largest input, so there
+            # is no memory to save by computing it lazily
+            lazy = False
+
+        if lazy:
+            import dask.array as da
+            from dask.diagnostics import ProgressBar
+
         if isinstance(other, Quaternion):
             if lazy:
                 darr = self._outer_dask(other, chunk_size=chunk_size)
-                qu = np.empty(darr.shape)
+                qu = np.empty(darr.shape, dtype=darr.dtype)
                 if progressbar:
                     with ProgressBar():
                         da.store(darr, qu)
                 else:
                     da.store(darr, qu)
             else:
-                if installed["numpy-quaternion"]:
-                    import quaternion
-
-                    qu1 = quaternion.from_float_array(self.data)
-                    qu2 = quaternion.from_float_array(other.data)
-                    # np.outer works with flattened array
-                    qu12 = np.outer(qu1, qu2).reshape(*qu1.shape, *qu2.shape)
-                    qu = quaternion.as_float_array(qu12)
-                else:  # pragma: no cover
-                    Q12 = Quaternion(self).reshape(-1, 1) * other.reshape(1, -1)
-                    qu = Q12.data.reshape(*self.shape, *other.shape, 4)
+                qu = qu_multiply_outer(self.data, other.data)
             return other.__class__(qu)
         elif isinstance(other, Vector3d):
             if lazy:
                 darr = self._outer_dask(other, chunk_size=chunk_size)
-                v_arr = np.empty(darr.shape)
+                v_arr = np.empty(darr.shape, dtype=darr.dtype)
                 if progressbar:
                     with ProgressBar():
                         da.store(darr, v_arr)
                 else:
                     da.store(darr, v_arr)
             else:
-                if installed["numpy-quaternion"]:
-                    import quaternion
-
-                    qu = quaternion.from_float_array(self.data)
-                    v_arr = quaternion.rotate_vectors(qu, other.data)
-                else:  # pragma: no cover
-                    v = Quaternion(self).reshape(-1, 1) * other.reshape(1, -1)
-                    v_arr = v.reshape(*self.shape, *other.shape).data
+                v_arr = qu_rotate_vec_outer(self.data, other.data)
             if isinstance(other, Miller):
                 m = other.__class__(xyz=v_arr, phase=other.phase)
                 m.coordinate_format = other.coordinate_format
@@ -1124,7 +1125,7 @@ class Quaternion(Object3d):
     # -------------------- Other private methods --------------------- #
 
     def _outer_dask(
-        self, other: Union[Quaternion, Vector3d], chunk_size: int = 20
+        self, other: Union[Quaternion, Vector3d], chunk_size: Optional[int] = None
     ) -> da.Array:
         """Compute the product of every quaternion in this instance to
         every quaternion or vector in another instance, returned as a
@@ -1139,7 +1140,9 @@ class Quaternion(Object3d):
             Another orientation or vector.
         chunk_size
             Number of objects per axis for each input to include in each
-            iteration of the computation. Default is 20.
+            iteration of the computation. If not given (default), it is
+            chosen so that each chunk of the output is about the size of
+            Dask's ``array.chunk-size`` configuration.
 
         Returns
         -------
@@ -1158,82 +1161,55 @@ class Quaternion(Object3d):
         quaternion-vector multiplication, to create a new vector from
         the returned array do ``v = Vector3d(out.compute())``.
         """
+        import dask
+        import dask.array as da
+
         if not isinstance(other, (Quaternion, Vector3d)):
             raise TypeError("Other must be Quaternion or Vector3d.")
 
         ndim1 = len(self.shape)
         ndim2 = len(other.shape)
 
-        # Set chunk sizes
+        # Set chunk sizes. The compiled kernels create no intermediate
+        # arrays, so the output chunks can be as large as Dask suggests.
+        if chunk_size is None:
+            nbytes = dask.utils.parse_bytes(dask.config.get("array.chunk-size"))
+            dtype = _float_dtype(self.data, other.data)
+            nbytes_per_item = other.dim * dtype.itemsize
+            ndim = max(ndim1 + ndim2, 1)
+            chunk_size = max(int((nbytes / nbytes_per_item) ** (1 / ndim)), 1)
         chunks1 = (chunk_size,) * ndim1 + (-1,)
         chunks2 = (chunk_size,) * ndim2 + (-1,)
 
-        # Dask has no dask.multiply.outer(), use dask.array.einsum
-        # Summation subscripts
+        # Dask has no dask.multiply.outer(), so compute the outer
+        # product of each pair of blocks with a compiled loop
         str1 = "abcdefghijklm"[:ndim1]  # Max. object dimension of 13
         str2 = "nopqrstuvwxyz"[:ndim2]
-        sum_over = f"...{str1},{str2}...->{str1 + str2}"
 
-        # Get quaternion parameters as dask arrays to be computed later
         Q1 = da.from_array(self.data, chunks=chunks1)
-        a1, b1, c1, d1 = Q1[..., 0], Q1[..., 1], Q1[..., 2], Q1[..., 3]
+        if isinstance(other, Quaternion):
+            func = qu_multiply_outer
+            n = 4
+        else:  # Vector3d
+            func = qu_rotate_vec_outer
+            n = 3
+        arr2 = da.from_array(other.data, chunks=chunks2)
 
-        # We silence dask's einsum performance warnings for "small"
-        # chunk sizes, since using the chunk sizes suggested floods
-        # memory
+        # We silence dask's performance warnings for "small" chunk
+        # sizes, since using the chunk sizes suggested floods memory
         warnings.filterwarnings("ignore", category=da.PerformanceWarning)
 
-        if isinstance(other, Quaternion):
-            Q2 = da.from_array(other.data, chunks=chunks2)
-            a2, b2, c2, d2 = Q2[..., 0], Q2[..., 1], Q2[..., 2], Q2[..., 3]
-            # fmt: off
-            a = (
-                + da.einsum(sum_over, a1, a2)
-                - da.einsum(sum_over, b1, b2)
-                - da.einsum(sum_over, c1, c2)
-                - da.einsum(sum_over, d1, d2)
-            )
-            b = (
-                + da.einsum(sum_over, b1, a2)
-                + da.einsum(sum_over, a1, b2)
-                - da.einsum(sum_over, d1, c2)
-                + da.einsum(sum_over, c1, d2)
-            )
-            c = (
-                + da.einsum(sum_over, c1, a2)
-                + da.einsum(sum_over, d1, b2)
-                + da.einsum(sum_over, a1, c2)
-                - da.einsum(sum_over, b1, d2)
-            )
-            d = (
-                + da.einsum(sum_over, d1, a2)
-                - da.einsum(sum_over, c1, b2)
-                + da.einsum(sum_over, b1, c2)
-                + da.einsum(sum_over, a1, d2)
-            )
-            # fmt: on
-            out = da.stack([a, b, c, d], axis=-1)
-        else:  # Vector3d
-            v2 = da.from_array(other.data, chunks=chunks2)
-            x2, y2, z2 = v2[..., 0], v2[..., 1], v2[..., 2]
-            # fmt: off
-            x = (
-                + da.einsum(sum_over, a1**2 + b1**2 - c1**2 - d1**2, x2)
-                + da.einsum(sum_over, a1 * c1 + b1 * d1, z2) * 2
-                + da.einsum(sum_over, b1 * c1 - a1 * d1, y2) * 2
-            )
-            y = (
-                + da.einsum(sum_over, a1**2 - b1**2 + c1**2 - d1**2, y2)
-                + da.einsum(sum_over, a1 * d1 + b1 * c1, x2) * 2
-                + da.einsum(sum_over, c1 * d1 - a1 * b1, z2) * 2
-            )
-            z = (
-                + da.einsum(sum_over, a1**2 - b1**2 - c1**2 + d1**2, z2)
-                + da.einsum(sum_over, a1 * b1 + c1 * d1, y2) * 2
-                + da.einsum(sum_over, b1 * d1 - a1 * c1, x2) * 2
-            )
-            # fmt: on
-            out = da.stack([x, y, z], axis=-1)
+        out = da.blockwise(
+            func,
+            str1 + str2 + "0",
+            Q1,
+            str1 + "1",
+            arr2,
+            str2 + "2",
+            new_axes={"0": n},
+            concatenate=True,
+            dtype=_float_dtype(self.data, other.data),
+        )
 
         new_chunks = tuple(chunks1[:-1]) + tuple(chunks2[:-1]) + (-1,)
 
@@ -1250,19 +1226,26 @@ class Quaternion(Object3d):
 # the input and output arrays both have single dimensions of size n.
 # The final input parameter (array) is overwritten inside the function,
 # with no return.
-# Ensure float64 to avoid surprising errors (some occured during
-# testing).
-
-
-@nb.guvectorize("(n)->(n)", cache=True)
-def qu_conj_gufunc(qu: np.ndarray, qu2: np.ndarray) -> None:  # pragma: no cover
-    qu2[0] = qu[0]
-    qu2[1] = -qu[1]
-    qu2[2] = -qu[2]
-    qu2[3] = -qu[3]
-
-
-@nb.guvectorize("(n),(n)->(n)", cache=True)
+# Ensure float32 or float64 to avoid surprising errors (some occured
+# during testing). Single precision is kept only if all inputs are in
+# single precision.
+
+
+def _float_dtype(*arrays: np.ndarray) -> np.dtype:
+    if all(arr.dtype == np.float32 for arr in arrays):
+        return np.dtype(np.float32)
+    else:
+        return np.dtype(np.float64)
+
+
+@nb.guvectorize(
+    [
+        "void(float32[:], float32[:], float32[:])",
+        "void(float64[:], float64[:], float64[:])",
+    ],
+    "(n),(n)->(n)",
+    cache=True,
+)
 def qu_multiply_gufunc(
     qu1: np.ndarray, qu2: np.ndarray, qu12: np.ndarray
 ) -> None:  # pragma: no cover
@@ -1272,39 +1255,259 @@ def qu_multiply_gufunc(
     qu12[3] = qu1[3] * qu2[0] - qu1[2] * qu2[1] + qu1[1] * qu2[2] + qu1[0] * qu2[3]
 
 
-def qu_multiply(qu1: np.ndarray, qu2: np.ndarray) -> np.ndarray:  # pragma: no cover
+def qu_multiply(qu1: np.ndarray, qu2: np.ndarray) -> np.ndarray:
     shape = np.broadcast_shapes(qu1.shape, qu2.shape)
-    if not np.issubdtype(qu1.dtype, np.float64):
-        qu1 = qu1.astype(np.float64)
-    if not np.issubdtype(qu2.dtype, np.float64):
-        qu2 = qu2.astype(np.float64)
-    qu12 = np.empty(shape, dtype=np.float64)
-    qu_multiply_gufunc(qu1, qu2, qu12)
+    dtype = _float_dtype(qu1, qu2)
+    qu1 = qu1.astype(dtype, copy=False)
+    qu2 = qu2.astype(dtype, copy=False)
+    qu12 = np.empty(shape, dtype=dtype)
+    if qu1.shape == qu2.shape:
+        qu1 = np.ascontiguousarray(qu1).reshape(-1, 4)
+        qu2 = np.ascontiguousarray(qu2).reshape(-1, 4)
+        qu_multiply_2d(qu1, qu2, qu12.reshape(-1, 4))
+    else:
+        qu_multiply_gufunc(qu1, qu2, qu12)
     return qu12
 
 
-@nb.guvectorize("(n),(m)->(m)", cache=True)
+# Row-wise loops without broadcasting are easier for the compiler to
+# vectorize than the gufuncs, and are used for arrays of equal shape
+
+
+@nb.njit(
+    [
+        "void(float32[:, ::1], float32[:, ::1], float32[:, ::1])",
+        "void(float64[:, ::1], float64[:, ::1], float64[:, ::1])",
+    ],
+    cache=True,
+    nogil=True,
+)
+def qu_multiply_2d(
+    qu1: np.ndarray, qu2: np.ndarray, qu12: np.ndarray
+) -> None:  # pragma: no cover
+    for i in range(qu1.shape[0]):
+        a1, b1, c1, d1 = qu1[i, 0], qu1[i, 1], qu1[i, 2], qu1[i, 3]
+        a2, b2, c2, d2 = qu2[i, 0], qu2[i, 1], qu2[i, 2], qu2[i, 3]
+        qu12[i, 0] = a1 * a2 - b1 * b2 - c1 * c2 - d1 * d2
+        qu12[i, 1] = b1 * a2 + a1 * b2 - d1 * c2 + c1 * d2
+        qu12[i, 2] = c1 * a2 + d1 * b2 + a1 * c2 - b1 * d2
+        qu12[i, 3] = d1 * a2 - c1 * b2 + b1 * c2 + a1 * d2
+
+
+@nb.njit(
+    [
+        "void(float32[:, ::1], float32[:, ::1], float32[:, ::1])",
+        "void(float64[:, ::1], float64[:, ::1], float64[:, ::1])",
+    ],
+    cache=True,
+    nogil=True,
+)
+def qu_rotate_vec_2d(
+    qu: np.ndarray, v1: np.ndarray, v2: np.ndarray
+) -> None:  # pragma: no cover
+    for i in range(qu.shape[0]):
+        a, b, c, d = qu[i, 0], qu[i, 1], qu[i, 2], qu[i, 3]
+        x, y, z = v1[i, 0], v1[i, 1], v1[i, 2]
+        norm2 = a * a + b * b + c * c + d * d
+        scale = 2 / norm2 if norm2 > 0 else 0
+        tx = scale * (c * z - d * y)
+        ty = scale * (d * x - b * z)
+        tz = scale * (b * y - c * x)
+        v2[i, 0] = x + a * tx - d * ty + c * tz
+        v2[i, 1] = y + d * tx + a * ty - b * tz
+        v2[i, 2] = z - c * tx + b * ty + a * tz
+
+
+@nb.njit(
+    [
+        "void(float32[:, ::1], float32[:, ::1])",
+        "void(float64[:, ::1], float64[:, ::1])",
+    ],
+    cache=True,
+    nogil=True,
+)
+def qu_invert_2d(qu: np.ndarray, qu_inv: np.ndarray) -> None:  # pragma: no cover
+    for i in range(qu.shape[0]):
+        a, b, c, d = qu[i, 0], qu[i, 1], qu[i, 2], qu[i, 3]
+        norm2 = a * a + b * b + c * c + d * d
+        # Zero quaternions have no inverse
+        scale = 1 / norm2 if norm2 > 0 else np.nan
+        qu_inv[i, 0] = a * scale
+        qu_inv[i, 1] = -b * scale
+        qu_inv[i, 2] = -c * scale
+        qu_inv[i, 3] = -d * scale
+
+
+@nb.njit(
+    [
+        "void(float32[:, ::1], float32[:, ::1], float32[:, :, ::1])",
+        "void(float64[:, ::1], float64[:, ::1], float64[:, :, ::1])",
+    ],
+    cache=True,
+    nogil=True,
+)
+def qu_multiply_outer_2d(
+    qu1: np.ndarray, qu2: np.ndarray, qu12: np.ndarray
+) -> None:  # pragma: no cover
+    for i in range(qu1.shape[0]):
+        a1, b1, c1, d1 = qu1[i, 0], qu1[i, 1], qu1[i, 2], qu1[i, 3]
+        for j in range(qu2.shape[0]):
+            a2, b2, c2, d2 = qu2[j, 0], qu2[j, 1], qu2[j, 2], qu2[j, 3]
+            qu12[i, j, 0] = a1 * a2 - b1 * b2 - c1 * c2 - d1 * d2
+            qu12[i, j, 1] = b1 * a2 + a1 * b2 - d1 * c2 + c1 * d2
+            qu12[i, j, 2] = c1 * a2 + d1 * b2 + a1 * c2 - b1 * d2
+            qu12[i, j, 3] = d1 * a2 - c1 * b2 + b1 * c2 + a1 * d2
+
+
+def qu_multiply_outer(qu1: np.ndarray, qu2: np.ndarray) -> np.ndarray:
+    dtype = _float_dtype(qu1, qu2)
+    qu1 = np.ascontiguousarray(qu1, dtype=dtype)
+    qu2 = np.ascontiguousarray(qu2, dtype=dtype)
+    qu12 = np.empty(qu1.shape[:-1] + qu2.shape[:-1] + (4,), dtype=dtype)
+    qu1_2d = qu1.reshape(-1, 4)
+    qu2_2d = qu2.reshape(-1, 4)
+    qu_multiply_outer_2d(
+        qu1_2d, qu2_2d, qu12.reshape(qu1_2d.shape[0], qu2_2d.shape[0], 4)
+    )
+    return qu12
+
+
+@nb.njit(
+    [
+        "void(float32[:, ::1], float32[:, ::1], float32[:, :, ::1])",
+        "void(float64[:, ::1], float64[:, ::1], float64[:, :, ::1])",
+    ],
+    cache=True,
+    nogil=True,
+)
+def qu_rotate_vec_outer_2d(
+    qu: np.ndarray, v1: np.ndarray, v2: np.ndarray
+) -> None:  # pragma: no cover
+    for i in range(qu.shape[0]):
+        a, b, c, d = qu[i, 0], qu[i, 1], qu[i, 2], qu[i, 3]
+        norm2 = a * a + b * b + c * c + d * d
+        scale = 2 / norm2 if norm2 > 0 else 0
+        # Each quaternion is applied to many vectors, so it pays off to
+        # convert it to a rotation matrix first
+        r00 = 1 - scale * (c * c + d * d)
+        r01 = scale * (b * c - a * d)
+        r02 = scale * (b * d + a * c)
+        r10 = scale * (b * c + a * d)
+        r11 = 1 - scale * (b * b + d * d)
+        r12 = scale * (c * d - a * b)
+        r20 = scale * (b * d - a * c)
+        r21 = scale * (c * d + a * b)
+        r22 = 1 - scale * (b * b + c * c)
+        for j in range(v1.shape[0]):
+            x, y, z = v1[j, 0], v1[j, 1], v1[j, 2]
+            v2[i, j, 0] = r00 * x + r01 * y + r02 * z
+            v2[i, j, 1] = r10 * x + r11 * y + r12 * z
+            v2[i, j, 2] = r20 * x + r21 * y + r22 * z
+
+
+def qu_rotate_vec_outer(qu: np.ndarray, v: np.ndarray) -> np.ndarray:
+    dtype = _float_dtype(qu, v)
+    qu = np.ascontiguousarray(qu, dtype=dtype)
+    v = np.ascontiguousarray(v, dtype=dtype)
+    v2 = np.empty(qu.shape[:-1] + v.shape[:-1] + (3,), dtype=dtype)
+    qu_2d = qu.reshape(-1, 4)
+    v_2d = v.reshape(-1, 3)
+    qu_rotate_vec_outer_2d(qu_2d, v_2d, v2.reshape(qu_2d.shape[0], v_2d.shape[0], 3))
+    return v2
+
+
+def qu_invert(qu: np.ndarray) -> np.ndarray:
+    dtype = _float_dtype(qu)
+    qu = np.ascontiguousarray(qu, dtype=dtype)
+    qu_inv = np.empty(qu.shape, dtype=dtype)
+    qu_invert_2d(qu.reshape(-1, 4), qu_inv.reshape(-1, 4))
+    return qu_inv
+
+
+@nb.guvectorize(
+    [
+        "void(float32[:], float32[:], float32[:], float32[:])",
+        "void(float64[:], float64[:], float64[:], float64[:])",
+    ],
+    "(n),(n),(n)->(n)",
+    cache=True,
+)
+def qu_triple_cross_gufunc(
+    qu1: np.ndarray, qu2: np.ndarray, qu3: np.ndarray, qu123: np.ndarray
+) -> None:  # pragma: no cover
+    a1, b1, c1, d1 = qu1
+    a2, b2, c2, d2 = qu2
+    a3, b3, c3, d3 = qu3
+    # fmt: off
+    qu123[0] = (
+        + b1 * c2 * d3 - b1 * c3 * d2 - b2 * c1 * d3
+        + b2 * c3 * d1 + b3 * c1 * d2 - b3 * c2 * d1
+    )
+    qu123[1] = (
+        + a1 * c3 * d2 - a1 * c2 * d3 + a2 * c1 * d3
+        - a2 * c3 * d1 - a3 * c1 * d2 + a3 * c2 * d1
+    )
+    qu123[2] = (
+        + a1 * b2 * d3 - a1 * b3 * d2 - a2 * b1 * d3
+        + a2 * b3 * d1 + a3 * b1 * d2 - a3 * b2 * d1
+    )
+    qu123[3] = (
+        + a1 * b3 * c2 - a1 * b2 * c3 + a2 * b1 * c3
+        - a2 * b3 * c1 - a3 * b1 * c2 + a3 * b2 * c1
+    )
+    # fmt: on
+
+
+def qu_triple_cross(qu1: np.ndarray, qu2: np.ndarray, qu3: np.ndarray) -> np.ndarray:
+    shape = np.broadcast_shapes(qu1.shape, qu2.shape, qu3.shape)
+    dtype = _float_dtype(qu1, qu2, qu3)
+    qu1 = qu1.astype(dtype, copy=False)
+    qu2 = qu2.astype(dtype, copy=False)
+    qu3 = qu3.astype(dtype, copy=False)
+    qu123 = np.empty(shape, dtype=dtype)
+    qu_triple_cross_gufunc(qu1, qu2, qu3, qu123)
+    return qu123
+
+
+@nb.guvectorize(
+    [
+        "void(float32[:], float32[:], float32[:])",
+        "void(float64[:], float64[:], float64[:])",
+    ],
+    "(n),(m)->(m)",
+    cache=True,
+)
 def qu_rotate_vec_gufunc(
     qu: np.ndarray, v1: np.ndarray, v2: np.ndarray
 ) -> None:  # pragma: no cover
     a, b, c, d = qu
     x, y, z = v1
-    tx = 2 * (c * z - d * y)
-    ty = 2 * (d * x - b * z)
-    tz = 2 * (b * y - c * x)
+    # All terms added to the vector are quadratic in the quaternion
+    # components, so dividing by the squared norm here is equivalent to
+    # rotating by the unit quaternion. Zero quaternions leave the vector
+    # unchanged.
+    norm2 = a * a + b * b + c * c + d * d
+    scale = 2 / norm2 if norm2 > 0 else 0
+    tx = scale * (c * z - d * y)
+    ty = scale * (d * x - b * z)
+    tz = scale * (b * y - c * x)
     v2[0] = x + a * tx - d * ty + c * tz
     v2[1] = y + d * tx + a * ty - b * tz
     v2[2] = z - c * tx + b * ty + a * tz
 
 
-def qu_rotate_vec(qu: np.ndarray, v: np.ndarray) -> np.ndarray:  # pragma: no cover
+def qu_rotate_vec(qu: np.ndarray, v: np.ndarray) -> np.ndarray:
     qu = np.atleast_2d(qu)
     v = np.atleast_2d(v)
     shape = np.broadcast_shapes(qu.shape[:-1], v.shape[:-1]) + (3,)
-    if not np.issubdtype(qu.dtype, np.float64):
-        qu = qu.astype(np.float64)
-    if not np.issubdtype(v.dtype, np.float64):
-        v = v.astype(np.float64)
-    v2 = np.empty(shape, dtype=np.float64)
-    qu_rotate_vec_gufunc(qu, v, v2)
+    dtype = _float_dtype(qu, v)
+    qu = qu.astype(dtype, copy=False)
+    v = v.astype(dtype, copy=False)
+    v2 = np.empty(shape, dtype=dtype)
+    if qu.shape[:-1] == v.shape[:-1]:
+        qu = np.ascontiguousarray(qu).reshape(-1, 4)
+        v = np.ascontiguousarray(v).reshape(-1, 3)
+        qu_rotate_vec_2d(qu, v, v2.reshape(-1, 3))
+    else:
+        qu_rotate_vec_gufunc(qu, v, v2)
     return v2
@@ -17,10 +17,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Tuple, Union
+from typing import Any, Optional, Tuple, Union
 
-import dask.array as da
-from dask.diagnostics import ProgressBar
 import numpy as np
 from scipy.special import hyp0f1
 
@@ -97,7 +95,7 @@ class Rotation(Quaternion):
     @property
     def antipodal(self) -> Rotation:
         """Return the rotation and its antipodal."""
-        R = self.__class__(np.stack([self.data, -self.data]))
+        R = super().antipodal
         R.improper = self.improper
         return R
 
@@ -137,7 +135,10 @@ class Rotation(Quaternion):
 
     def __getitem__(self, key) -> Rotation:
         R = super().__getitem__(key)
-        R.improper = self.improper[key]
+        # Return a copy of basic slices, so that setting the improper
+        # flags or data of the slice does not change this instance
+        if np.may_share_memory(R._data, self._data):
+            R._data = R._data.copy()
         return R
 
     def __invert__(self) -> Rotation:
@@ -159,6 +160,32 @@ class Rotation(Quaternion):
 
     # ------------------------ Class methods ------------------------- #
 
+    @classmethod
+    def empty(cls) -> Rotation:
+        """Return an empty rotation with the appropriate dimensions."""
+        # Make room for the improper flag
+        return cls._from_data(np.empty((0, cls.dim + 1)))
+
+    @classmethod
+    def identity(cls, shape: Union[int, tuple] = (1,)) -> Rotation:
+        """Create identity rotations.
+
+        Parameters
+        ----------
+        shape
+            Shape of the rotation instance.
+
+        Returns
+        -------
+        R
+            Identity rotations.
+        """
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        # Make room for the improper flag
+        data = np.zeros(shape + (cls.dim + 1,))
+        data[..., 0] = 1
+        return cls._from_data(data)
+
     @classmethod
     def random_vonmises(
         cls,
@@ -344,7 +371,7 @@ class Rotation(Quaternion):
         self,
         other: Union[Rotation, Vector3d],
         lazy: bool = False,
-        chunk_size: int = 20,
+        chunk_size: Optional[int] = None,
         progressbar: bool = True,
     ) -> Union[Rotation, Vector3d]:
         """Return the outer rotation products of the rotations and the
@@ -360,7 +387,9 @@ class Rotation(Quaternion):
             with large arrays. Default is ``False``.
         chunk_size
             Number of rotations per axis to include in each iteration of
-            the computation. Default is 20. Only applies when
+            the computation. If not given (default), it is chosen so
+            that each chunk of the output is about the size of Dask's
+            ``array.chunk-size`` configuration. Only applies when
             ``lazy=True``. Increasing this might reduce the computation
             time at the cost of increased memory use.
         progressbar
@@ -372,9 +401,17 @@ class Rotation(Quaternion):
         R
             Outer rotation products.
         """
+        if isinstance(other, (Quaternion, Vector3d)) and 1 in (self.size, other.size):
+            # The output is no larger than the largest input, so there
+            # is no memory to save by computing it lazily
+            lazy = False
+
         if lazy:
+            import dask.array as da
+            from dask.diagnostics import ProgressBar
+
             darr = self._outer_dask(other, chunk_size=chunk_size)
-            arr = np.empty(darr.shape)
+            arr = np.empty(darr.shape, dtype=darr.dtype)
             if progressbar:
                 with ProgressBar():
                     da.store(darr, arr)
@@ -24,7 +24,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 
-from orix import constants
 from orix.crystal_map import CrystalMap, PhaseList, create_coordinate_arrays
 from orix.quaternion import Rotation
 
@@ -35,16 +34,6 @@ def pytest_sessionstart(session):  # pragma: no cover
     plt.rcParams["backend"] = "agg"
 
 
-# -------------------- Control of test selection --------------------- #
-
-skipif_numpy_quaternion_present = pytest.mark.skipif(
-    constants.installed["numpy-quaternion"], reason="numpy-quaternion installed"
-)
-
-skipif_numpy_quaternion_missing = pytest.mark.skipif(
-    not constants.installed["numpy-quaternion"], reason="numpy-quaternion not installed"
-)
-
 # ---------------------------- IO fixtures --------------------------- #
 
 # ----------------------------- .ang file ---------------------------- #
@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with orix.  If not, see <http://www.gnu.org/licenses/>.
 
+import dask
 import dask.array as da
 from diffpy.structure.spacegroups import sg225
 import numpy as np
@@ -81,6 +82,20 @@ class TestQuaternion:
     def test_unit(self, quaternion):
         assert np.allclose(quaternion.unit.norm, 1)
 
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            ([2, 0, 0, 2], [0, 0, 1]),
+            ([-0.5, 0.5, 0, 0], [-1, 0, 0]),
+            ([[1, 0, 0, 0], [-3, 0, 0, 0]], [[0, 0, 1], [0, 0, -1]]),
+            ([[0, 1, 1, 0], [-1, 3, 0, 4]], [[0.5**0.5, 0.5**0.5, 0], [-0.6, 0, -0.8]]),
+        ],
+    )
+    def test_axis(self, data, expected):
+        axis = Quaternion(data).axis
+        assert isinstance(axis, Vector3d)
+        assert np.allclose(axis.data, expected)
+
     def test_conj(self, quaternion):
         q = quaternion
         assert np.allclose(q.data[..., 0], q.conj.data[..., 0])
@@ -161,6 +176,12 @@ class TestQuaternion:
         v2 = Q1 * v1
         assert np.allclose(v2.data, expected)
 
+    def test_multiply_vector_non_unit(self):
+        Q1 = Quaternion.random(10)
+        Q2 = Quaternion(Q1.data * np.arange(1, 11)[:, np.newaxis])
+        v1 = Vector3d.random(10)
+        assert np.allclose((Q2 * v1).data, (Q1 * v1).data)
+
     def test_multiply_vector_float32(self):
         Q1 = Quaternion.random()
         v1 = Vector3d.random()
@@ -172,6 +193,56 @@ class TestQuaternion:
         v3 = Q2 * v1
         assert np.allclose(v3.data, v2.data, atol=1e-6)
 
+    def test_multiply_float32(self):
+        Q1 = Quaternion.random(10)
+        v1 = Vector3d.random(10)
+        Q2 = Quaternion(Q1.data.astype(np.float32))
+        v2 = Vector3d(v1.data.astype(np.float32))
+
+        # Single precision is kept if all operands are single precision
+        Q12 = Q2 * Q2
+        assert Q12.data.dtype == np.float32
+        assert np.allclose(Q12.data, (Q1 * Q1).data, atol=1e-6)
+        assert (~Q2).data.dtype == np.float32
+        v12 = Q2 * v2
+        assert v12.data.dtype == np.float32
+        assert np.allclose(v12.data, (Q1 * v1).data, atol=1e-6)
+
+        # Mixed precision gives double precision
+        assert (Q1 * Q2).data.dtype == np.float64
+        assert (Q2 * v1).data.dtype == np.float64
+
+    def test_outer_float32(self):
+        Q1 = Quaternion.random((3, 2))
+        Q2 = Quaternion(Q1.data.astype(np.float32))
+        Q12 = Q2.outer(Q2)
+        assert Q12.data.dtype == np.float32
+        assert np.allclose(Q12.data, Q1.outer(Q1).data, atol=1e-6)
+        assert Q1.outer(Q2).data.dtype == np.float64
+        Q12_lazy = Q2.outer(Q2, lazy=True, progressbar=False)
+        assert Q12_lazy.data.dtype == np.float32
+        assert np.allclose(Q12_lazy.data, Q12.data)
+        v = Vector3d(Vector3d.random(4).data.astype(np.float32))
+        assert Q2.outer(v).data.dtype == np.float32
+        assert Q2.outer(v, lazy=True, progressbar=False).data.dtype == np.float32
+
+    def test_multiply_equal_shapes_broadcast(self):
+        # Equal shapes use row-wise loops, others broadcast with gufuncs
+        Q1 = Quaternion.random((4, 3))
+        Q2 = Quaternion.random((4, 3))
+        v1 = Vector3d.random((4, 3))
+        Q12 = Q1 * Q2
+        v2 = Q1 * v1
+        for i in range(4):
+            assert np.allclose(Q12[i].data, (Q1[i] * Q2[i]).data)
+            assert np.allclose(Q12[i].data, (Q1[i] * Q2[i][np.newaxis]).data[0])
+            assert np.allclose(v2[i].data, (Q1[i] * v1[i]).data)
+            assert np.allclose(v2[i].data, (Q1[i] * v1[i][np.newaxis]).data[0])
+
+        # Non-contiguous data
+        Q3 = Quaternion(Q1.data.transpose(1, 0, 2))
+        assert np.allclose((Q3 * Q3).data, (Q1 * Q1).data.transpose(1, 0, 2))
+
     def test_abcd_properties(self):
         quat = Quaternion([2, 2, 2, 2])
         quat.a = 1
@@ -239,6 +310,18 @@ class TestQuaternion:
 
         assert np.allclose(outer1.compute(), outer2.compute())
 
+    def test_outer_lazy_chunk_size_auto(self):
+        Q = Quaternion.random(100)
+        v = Vector3d.random(100)
+        # 32 kiB per output chunk fits 32 x 32 quaternions (32 B each)
+        # or 36 x 36 vectors (24 B each)
+        with dask.config.set({"array.chunk-size": "32kiB"}):
+            outer1 = Q._outer_dask(Q)
+            outer2 = Q._outer_dask(v)
+        assert outer1.chunksize == (32, 32, 4)
+        assert outer2.chunksize == (36, 36, 3)
+        assert np.allclose(outer1.compute(), Q.outer(Q).data)
+
     @pytest.mark.parametrize("shape", [(2, 3), (4, 5, 6), (1, 5), (11,)])
     def test_outer_vector_lazy(self, shape):
         rng = np.random.default_rng()
@@ -287,6 +370,21 @@ class TestQuaternion:
         out, _ = capsys.readouterr()
         assert not out
 
+    def test_outer_lazy_single(self, capsys):
+        # Dask is not used if the output is no larger than the inputs
+        Q1 = Quaternion.random()
+        Q2 = Quaternion.random((3, 2))
+        Q12 = Q1.outer(Q2, lazy=True)
+        out, _ = capsys.readouterr()
+        assert not out
+        assert Q12.shape == (1, 3, 2)
+        assert np.allclose(Q12.data, Q1.outer(Q2).data)
+        v = Vector3d.random(4)
+        assert Q2.outer(Vector3d.random(), lazy=True).shape == (3, 2, 1)
+        assert Q1.outer(v, lazy=True).shape == (1, 4)
+        out, _ = capsys.readouterr()
+        assert not out
+
     def test_outer_dask_wrong_type_raises(self):
         shape = (5,)
         rng = np.random.default_rng()
@@ -327,6 +425,16 @@ class TestQuaternion:
         )
         assert np.allclose(q2.data, q1.data)
 
+    @pytest.mark.parametrize("shape", [(5,), (2, 3)])
+    def test_triple_cross(self, shape):
+        Q1, Q2, Q3 = [Quaternion.random(shape) for _ in range(3)]
+        Q123 = Quaternion.triple_cross(Q1, Q2, Q3)
+        assert isinstance(Q123, Quaternion)
+        assert Q123.shape == shape
+        # The product is orthogonal to all three quaternions
+        for Q in [Q1, Q2, Q3]:
+            assert np.allclose(Q123.dot(Q), 0)
+
     def test_equality(self):
         Q1 = Quaternion.from_axes_angles([1, 1, 1], -np.pi / 3)
         Q2 = Quaternion.from_axes_angles([1, 1, 1], np.pi / 3)
@@ -348,6 +456,15 @@ class TestToFromEuler:
         eu4 = Quaternion.from_euler(eu).to_euler(degrees=True)
         assert np.allclose(np.rad2deg(eu), eu4)
 
+    def test_from_euler_degrees_input_unchanged(self):
+        eu = np.array([[90, 45, 30], [10, 20, 30]])
+        eu_float = eu.astype(np.float64)
+        Q1 = Quaternion.from_euler(eu, degrees=True)
+        Q2 = Quaternion.from_euler(eu_float, degrees=True)
+        assert np.allclose(Q1.data, Q2.data)
+        assert np.allclose(Q2.data, Quaternion.from_euler(np.deg2rad(eu)).data)
+        assert np.array_equal(eu_float, eu)
+
     def test_direction_values(self, eu):
         q_mtex = Quaternion.from_euler(eu, direction="mtex")
         q_c2l = Quaternion.from_euler(eu, direction="crystal2lab")
@@ -475,6 +592,28 @@ class TestFromToAxesAngles:
         q = Quaternion.from_axes_angles([], [])
         assert q.size == 0
 
+    @pytest.mark.parametrize(
+        "axis, angle, shape",
+        [
+            ((1, 2, 3), 30, (1,)),
+            ([[1, 2, 3]], [30], (1,)),
+            ((1, 2, 3), [[30]], (1,)),
+            ([[[1, 2, 3]]], 30, (1, 1)),
+            ((0, 0, 0), 30, (1,)),
+            ((1, 2, 3), 0, (1,)),
+        ],
+    )
+    def test_from_axes_angles_single(self, axis, angle, shape):
+        # A single pair gives the same result as pairs in a batch
+        Q1 = Quaternion.from_axes_angles(axis, angle, degrees=True)
+        Q2 = Quaternion.from_axes_angles(
+            np.tile(np.reshape(axis, (1, 3)), (2, 1)),
+            np.full(2, np.ravel(angle)[0]),
+            degrees=True,
+        )
+        assert Q1.shape == shape
+        assert np.allclose(Q1.data.reshape(-1, 4), Q2[:1].data)
+
 
 class TestFromToRodrigues:
     """These tests address the Quaternion methods converting from and to
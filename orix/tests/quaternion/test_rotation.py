@@ -75,11 +75,45 @@ def test_slice(rotation):
     assert r.improper.shape == r.shape
 
 
+def test_slice_improper():
+    R = Rotation.random((3, 4))
+    R.improper = np.random.rand(3, 4) > 0.5
+    assert np.array_equal(R[1].improper, R.improper[1])
+    assert np.array_equal(R[:, 1:3].improper, R.improper[:, 1:3])
+    mask = R.improper.copy()
+    assert np.all(R[mask].improper)
+
+
+def test_slice_is_copy():
+    R = Rotation.random((3, 4))
+    improper = R.improper.copy()
+    data = R.data.copy()
+    R2 = R[1:3]
+    R2.improper = ~R2.improper
+    R2[0] = Rotation.identity()
+    assert np.array_equal(R.improper, improper)
+    assert np.array_equal(R.data, data)
+
+
 def test_unit(rotation):
     assert isinstance(rotation.unit, Rotation)
     assert np.allclose(rotation.unit.norm, 1)
 
 
+def test_unit_improper():
+    R = Rotation.random(4)
+    R.improper = [0, 1, 1, 0]
+    assert np.array_equal(R.unit.improper, R.improper)
+
+
+@pytest.mark.parametrize("shape, axes", [((3, 2), ()), ((3, 2, 4), (2, 0, 1))])
+def test_transpose_improper(shape, axes):
+    R = Rotation.random(shape)
+    R.improper = np.random.rand(*shape) > 0.5
+    R2 = R.transpose(*axes)
+    assert np.array_equal(R2.improper, R.improper.transpose(*axes))
+
+
 def test_equality():
     r1 = Rotation.random(5)
     r1_copy = Rotation(r1)
@@ -277,6 +311,7 @@ class TestUnique:
 
     def test_unique_empty(self):
         r = Rotation.empty()
+        assert r.improper.shape == r.shape == (0,)
         r2 = r.unique()
         assert r2.size == 0
 
@@ -513,6 +548,16 @@ def test_antipodal(rotation, improper):
     assert np.allclose(a[1].improper, rotation.improper)
 
 
+@pytest.mark.parametrize("shape", [(1,), (2, 3), 4])
+def test_identity(shape):
+    r = Rotation.identity(shape)
+    assert isinstance(r, Rotation)
+    assert r.shape == tuple(np.atleast_1d(shape))
+    assert r._data.shape[-1] == 5
+    assert np.allclose(r.data, [1, 0, 0, 0])
+    assert not np.any(r.improper)
+
+
 @pytest.mark.parametrize("shape, reference", [((1,), (1, 0, 0, 0))])
 def test_random_vonmises(shape, reference):
     r = Rotation.random_vonmises(shape, 1.0, reference)
@@ -17,14 +17,8 @@
 
 from orix import constants
 
-from .conftest import skipif_numpy_quaternion_missing, skipif_numpy_quaternion_present
-
 
 class TestConstants:
-    @skipif_numpy_quaternion_present
-    def test_numpy_quaternion_not_installed(self):
-        assert not constants.installed["numpy-quaternion"]
-
-    @skipif_numpy_quaternion_missing
-    def test_numpy_quaternion_installed(self):
-        assert constants.installed["numpy-quaternion"]
+    def test_numpy_quaternion_not_optional_dependency(self):
+        # No longer used by orix
+        assert "numpy-quaternion" not in constants.installed
@@ -18,7 +18,12 @@
 import numpy as np
 import pytest
 
-from orix._base import DimensionError, Object3d
+from orix._base import (
+    DimensionError,
+    Object3d,
+    _round_and_remove_zeros,
+    _unique_rows,
+)
 
 
 @pytest.fixture(
@@ -147,6 +152,10 @@ def test_slice(test_object3d, data, key):
     [
         (2, (5, 2), (slice(1), slice(1), slice(1)), IndexError),
         (3, (4, 4, 3), (6, 6), IndexError),
+        # Keys indexing the component axis
+        (3, (3, 2, 3), (Ellipsis, 0), DimensionError),
+        (3, (3, 2, 3), (0, 1, 2), DimensionError),
+        (3, (3, 2, 3), (Ellipsis, None), DimensionError),
     ],
     indirect=["test_object3d", "data"],
 )
@@ -180,6 +189,7 @@ def test_flatten(object3d):
     assert isinstance(flat, object3d.__class__)
     assert flat.ndim == 1
     assert flat.shape[0] == object3d.size
+    assert np.allclose(flat.data, object3d.data.T.reshape(object3d.dim, -1).T)
 
 
 @pytest.mark.parametrize("test_object3d", [1], indirect=["test_object3d"])
@@ -199,6 +209,42 @@ def test_unique(test_object3d):
     assert np.allclose(inv, [0, 0, 1, 2, 2])
 
 
+@pytest.mark.parametrize("test_object3d", [3], indirect=["test_object3d"])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int64])
+def test_unique_keeps_dtype(test_object3d, dtype):
+    o3d = test_object3d(np.array([[1, 0, 0], [0, 1, 0], [1, 0, 0]], dtype=dtype))
+    unique = o3d.unique()
+    assert unique.data.dtype == dtype
+    assert np.array_equal(unique.data, [[1, 0, 0], [0, 1, 0]])
+
+
+def test_round_and_remove_zeros():
+    np.random.seed(4)
+    data = np.random.rand(100, 3) * 2 - 1
+    data[::3] = 1e-9
+    data[1::3] *= 1e-11
+    expected = data.round(10)
+    expected = expected[~np.all(np.isclose(expected, 0), axis=1)]
+    data2 = _round_and_remove_zeros(data)
+    assert data2.shape == (33, 3)
+    assert np.array_equal(data2, expected)
+
+
+def test_unique_rows():
+    np.random.seed(4)
+    data = np.random.randint(-2, 3, size=(1000, 3)).astype(np.float64)
+    first, inv = _unique_rows(data.view(np.uint64))
+    _, idx_np, inv_np = np.unique(data, axis=0, return_index=True, return_inverse=True)
+    assert np.array_equal(first, np.sort(idx_np))
+    assert np.all(np.diff(first) > 0)
+    assert np.array_equal(data[first][inv], data)
+    assert inv.max() == first.size - 1
+    assert inv_np.max() == first.size - 1
+
+    first_empty, inv_empty = _unique_rows(np.zeros((0, 3), dtype=np.uint64))
+    assert first_empty.size == inv_empty.size == 0
+
+
 @pytest.mark.parametrize("test_object3d", [4], indirect=["test_object3d"])
 def test_get_random_sample(test_object3d):
     o3d = test_object3d(np.arange(80).reshape(5, 4, 4))
@@ -207,3 +253,16 @@ def test_get_random_sample(test_object3d):
 
     with pytest.raises(ValueError, match="Cannot draw a sample greater than 20"):
         _ = o3d.get_random_sample(21)
+
+
+@pytest.mark.parametrize("test_object3d", [4], indirect=["test_object3d"])
+def test_get_random_sample_rng(test_object3d):
+    o3d = test_object3d(np.arange(80).reshape(5, 4, 4))
+    o3d_sample1 = o3d.get_random_sample(10, rng=np.random.default_rng(42))
+    o3d_sample2 = o3d.get_random_sample(10, rng=np.random.default_rng(42))
+    assert np.allclose(o3d_sample1.data, o3d_sample2.data)
+
+    o3d_flat = o3d.reshape(-1)
+    o3d_sample3 = o3d_flat.get_random_sample(10, rng=np.random.default_rng(42))
+    assert o3d_sample3.shape == (10,)
+    assert np.allclose(o3d_sample3.data, o3d_sample1.data)
@@ -78,6 +78,9 @@ class Miller(Vector3d):
         W &= w.
     """
 
+    phase = None
+    _coordinate_format = "xyz"
+
     def __init__(
         self,
         xyz: Union[np.ndarray, list, tuple, None] = None,
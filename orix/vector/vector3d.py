@@ -18,10 +18,8 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
-import dask.array as da
-from dask.diagnostics import ProgressBar
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 import numpy as np
@@ -29,6 +27,9 @@ import numpy as np
 from orix import constants
 from orix._base import Object3d
 
+if TYPE_CHECKING:  # pragma: no cover
+    import dask.array as da
+
 
 class Vector3d(Object3d):
     r"""Three-dimensional vectors.
@@ -560,6 +561,9 @@ class Vector3d(Object3d):
                [0.5, 0.5]])
         """
         if lazy:
+            import dask.array as da
+            from dask.diagnostics import ProgressBar
+
             dots = np.empty(self.shape + other.shape)
             dp = self._dot_outer_dask(other, chunk_size)
             if progressbar:
@@ -1591,6 +1595,8 @@ class Vector3d(Object3d):
 
     def _dot_outer_dask(self, other: Vector3d, chunk_size: int = 20) -> da.Array:
         """Compute the lazy dot product between this vector and another."""
+        import dask.array as da
+
         ndim1 = self.ndim
         ndim2 = other.ndim
 